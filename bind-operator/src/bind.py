@@ -3,13 +3,15 @@
 
 """Bind charm business logic."""
 
+import functools
+import hashlib
+import json
 import logging
 import os
 import pathlib
-import shutil
 import subprocess  # nosec
-import tempfile
 import time
+import typing
 
 import ops
 import pydantic
@@ -46,65 +48,106 @@ class InstallError(SnapError):
     """Exception raised when unable to install dependencies for the service."""
 
 
+def _raise_as(
+    error_cls: type[SnapError],
+) -> typing.Callable[[typing.Callable], typing.Callable]:
+    """Translate snap failures of the decorated method to a charm exception.
+
+    The error message is only built on the failure path and the formatting
+    of the log arguments is deferred to the logging framework.
+
+    Args:
+        error_cls: the exception to raise when the snap operation fails
+
+    Returns:
+        A decorator wrapping the method with the snap error handling
+    """
+
+    def decorator(func: typing.Callable) -> typing.Callable:
+        """Wrap a BindService method with the snap error handling.
+
+        Args:
+            func: the method to wrap
+
+        Returns:
+            The wrapped method
+        """
+
+        @functools.wraps(func)
+        def wrapper(self: "BindService", *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            """Invoke the wrapped method and translate snap failures.
+
+            Args:
+                args: positional arguments of the wrapped method
+                kwargs: keyword arguments of the wrapped method
+
+            Returns:
+                The return value of the wrapped method
+
+            Raises:
+                error_cls: when the snap operation fails
+            """
+            try:
+                return func(self, *args, **kwargs)
+            except (snap.SnapError, snap.SnapNotFoundError, subprocess.CalledProcessError) as e:
+                error_msg = f"An exception occurred in {func.__name__}. Reason: {e}"
+                logger.error("An exception occurred in %s. Reason: %s", func.__name__, e)
+                raise error_cls(error_msg) from e
+
+        return wrapper
+
+    return decorator
+
+
 class BindService:
     """Bind service class."""
 
+    def __init__(self) -> None:
+        """Construct."""
+        # Instantiating a SnapCache parses the snapd state, so it is
+        # created once and reused by every snap operation
+        self._snap_cache: snap.SnapCache | None = None
+
+    def _charmed_bind(self) -> snap.Snap:
+        """Get the charmed-bind snap from the cached SnapCache.
+
+        Returns:
+            The charmed-bind Snap instance
+        """
+        if self._snap_cache is None:
+            self._snap_cache = snap.SnapCache()
+        return self._snap_cache[constants.DNS_SNAP_NAME]
+
+    @_raise_as(ReloadError)
     def reload(self, force_start: bool) -> None:
         """Reload the charmed-bind service.
 
+        Snap failures are raised as ReloadError by the _raise_as decorator.
+
         Args:
             force_start: start the service even if it was inactive
-
-        Raises:
-            ReloadError: when encountering a SnapError
         """
         logger.debug("Reloading charmed bind")
-        try:
-            cache = snap.SnapCache()
-            charmed_bind = cache[constants.DNS_SNAP_NAME]
-            charmed_bind_service = charmed_bind.services[constants.DNS_SNAP_SERVICE]
-            if charmed_bind_service["active"] or force_start:
-                charmed_bind.restart(reload=True)
-        except snap.SnapError as e:
-            error_msg = (
-                f"An exception occurred when reloading {constants.DNS_SNAP_NAME}. Reason: {e}"
-            )
-            logger.error(error_msg)
-            raise ReloadError(error_msg) from e
+        charmed_bind = self._charmed_bind()
+        charmed_bind_service = charmed_bind.services[constants.DNS_SNAP_SERVICE]
+        if charmed_bind_service["active"] or force_start:
+            charmed_bind.restart(reload=True)
 
+    @_raise_as(StartError)
     def start(self) -> None:
         """Start the charmed-bind service.
 
-        Raises:
-            StartError: when encountering a SnapError
+        Snap failures are raised as StartError by the _raise_as decorator.
         """
-        try:
-            cache = snap.SnapCache()
-            charmed_bind = cache[constants.DNS_SNAP_NAME]
-            charmed_bind.start()
-        except snap.SnapError as e:
-            error_msg = (
-                f"An exception occurred when stopping {constants.DNS_SNAP_NAME}. Reason: {e}"
-            )
-            logger.error(error_msg)
-            raise StartError(error_msg) from e
+        self._charmed_bind().start()
 
+    @_raise_as(StopError)
     def stop(self) -> None:
         """Stop the charmed-bind service.
 
-        Raises:
-            StopError: when encountering a SnapError
+        Snap failures are raised as StopError by the _raise_as decorator.
         """
-        try:
-            cache = snap.SnapCache()
-            charmed_bind = cache[constants.DNS_SNAP_NAME]
-            charmed_bind.stop()
-        except snap.SnapError as e:
-            error_msg = (
-                f"An exception occurred when stopping {constants.DNS_SNAP_NAME}. Reason: {e}"
-            )
-            logger.error(error_msg)
-            raise StopError(error_msg) from e
+        self._charmed_bind().stop()
 
     def setup(self, unit_name: str) -> None:
         """Prepare the machine.
@@ -124,25 +167,37 @@ class BindService:
     def _install_bind_reload_service(self, unit_name: str) -> None:
         """Install the bind reload service.
 
+        This is idempotent: the unit files are only rewritten when their
+        content changed and the timer is only enabled and started when it is
+        not already running, so calling this again (upgrade-charm) does not
+        trigger needless systemd IO.
+
         Args:
             unit_name: The name of the current unit
         """
-        (
-            pathlib.Path(constants.SYSTEMD_SERVICES_PATH) / "dispatch-reload-bind.service"
-        ).write_text(
-            templates.DISPATCH_EVENT_SERVICE.format(
+        unit_files = {
+            "dispatch-reload-bind.service": templates.DISPATCH_EVENT_SERVICE.format(
                 event="reload-bind",
                 timeout="10s",
                 unit=unit_name,
             ),
-            encoding="utf-8",
-        )
-        (pathlib.Path(constants.SYSTEMD_SERVICES_PATH) / "dispatch-reload-bind.timer").write_text(
-            templates.SYSTEMD_SERVICE_TIMER.format(interval="1", service="dispatch-reload-bind"),
-            encoding="utf-8",
-        )
-        systemd.service_enable("dispatch-reload-bind.timer")
-        systemd.service_start("dispatch-reload-bind.timer")
+            "dispatch-reload-bind.timer": templates.SYSTEMD_SERVICE_TIMER.format(
+                interval="1", service="dispatch-reload-bind"
+            ),
+        }
+        changed = False
+        for file_name, content in unit_files.items():
+            path = pathlib.Path(constants.SYSTEMD_SERVICES_PATH) / file_name
+            try:
+                if path.read_text(encoding="utf-8") == content:
+                    continue
+            except FileNotFoundError:
+                pass
+            path.write_text(content, encoding="utf-8")
+            changed = True
+        if changed or not systemd.service_running("dispatch-reload-bind.timer"):
+            # "--now" enables and starts in a single systemctl invocation
+            systemd.service_enable("--now", "dispatch-reload-bind.timer")
 
     def collect_status(
         self,
@@ -155,6 +210,10 @@ class BindService:
             event: Event triggering the collect-status hook
             relation_data: data coming from the relation databag
         """
+        # Avoid materializing the zones when there is no request at all
+        if not any(record_requirer_data.dns_entries for record_requirer_data, _ in relation_data):
+            event.add_status(ops.ActiveStatus())
+            return
         zones: list[models.Zone] = []
         for record_requirer_data, _ in relation_data:
             zones.extend(dns_data.record_requirer_data_to_zones(record_requirer_data))
@@ -164,18 +223,58 @@ class BindService:
         event.add_status(ops.ActiveStatus())
 
     def _write_file(self, path: pathlib.Path, content: str) -> None:
-        """Write a file to the filesystem.
+        """Atomically write a file to the filesystem.
+
+        The content is written to a sibling temporary file that is then
+        renamed over the destination: os.replace is atomic on POSIX, so a
+        reader never observes a partially written configuration file.
 
-        This function exists to be easily mocked during unit tests.
+        This function also exists to be easily mocked during unit tests.
 
         Args:
             path: path to the file
             content: content of the file
         """
-        pathlib.Path(path).write_text(
+        tmp_path = path.parent / f"{path.name}.tmp"
+        tmp_path.write_text(
             content,
             encoding="utf-8",
         )
+        os.replace(tmp_path, path)
+
+    def _read_zonefile_header(self, path: pathlib.Path) -> str | None:
+        """Read the hash header line of a zonefile.
+
+        Only the first line is read: the rest of the file is not needed
+        to decide whether the zone has changed.
+
+        Args:
+            path: path to the zonefile
+
+        Returns:
+            The first line of the file without its newline,
+            or None if the file does not exist.
+        """
+        try:
+            with open(path, encoding="utf-8") as zonefile:
+                return zonefile.readline().rstrip("\n")
+        except FileNotFoundError:
+            return None
+
+    def _state_hash_on_disk(self, path: pathlib.Path) -> str | None:
+        """Read the state hash stored in a state.json file.
+
+        Args:
+            path: path to the state file
+
+        Returns:
+            The stored hash, or None if the file is missing or unreadable.
+        """
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return state.get("hash")
 
     def update_zonefiles_and_reload(
         self,
@@ -198,73 +297,107 @@ class BindService:
         if len(conflicting) > 0:
             return
 
-        # Create staging area
-        # This is done to avoid having a partial configuration remaining if something goes wrong.
-        with tempfile.TemporaryDirectory() as tempdir:
-
-            # Write the serialized state to a json file for future comparison
-            self._write_file(
-                pathlib.Path(constants.DNS_CONFIG_DIR) / "state.json",
-                dns_data.dump_state(zones, topology),
-            )
-
-            # Write the service.test file
+        # Each file is written atomically (see _write_file), so a failure
+        # halfway through never leaves a partially written configuration file.
+        # We track whether anything was effectively rewritten: when every file
+        # is already up to date (the common case on the every-minute timer),
+        # the reload is skipped entirely.
+        changed = False
+
+        # Write the serialized state to a json file for future comparison
+        state_path = pathlib.Path(constants.DNS_CONFIG_DIR) / "state.json"
+        if self._state_hash_on_disk(state_path) != dns_data.state_hash(zones, topology):
+            self._write_file(state_path, dns_data.dump_state(zones, topology))
+            changed = True
+
+        # Write the service.test file
+        service_zone_path = (
+            pathlib.Path(constants.DNS_CONFIG_DIR) / f"db.{constants.ZONE_SERVICE_NAME}"
+        )
+        if not service_zone_path.exists():
             self._write_file(
-                pathlib.Path(constants.DNS_CONFIG_DIR) / f"db.{constants.ZONE_SERVICE_NAME}",
+                service_zone_path,
                 templates.ZONE_SERVICE.format(
                     serial=int(time.time() / 60),
                 ),
             )
+            changed = True
 
-            if topology is not None and topology.is_current_unit_active:
-                # Write zone files
-                zone_files: dict[str, str] = self._zones_to_files_content(zones, topology)
-                for domain, content in zone_files.items():
-                    self._write_file(pathlib.Path(tempdir) / f"db.{domain}", content)
+        if topology is not None and topology.is_current_unit_active:
+            changed |= self._update_zone_files(zones, topology)
 
-            # Write the named.conf file
-            self._write_file(
-                pathlib.Path(tempdir) / "named.conf.local",
-                self._generate_named_conf_local([z.domain for z in zones], topology),
-            )
-
-            # Move the staging area files to the config dir
-            for file_name in os.listdir(tempdir):
-                shutil.move(
-                    pathlib.Path(tempdir) / file_name,
-                    pathlib.Path(constants.DNS_CONFIG_DIR, file_name),
-                )
+        changed |= self._update_named_conf_local([z.domain for z in zones], topology)
 
         # Reload charmed-bind config (only if already started).
         # When stopped, we assume this was on purpose.
         # We can be here following a regular reload-bind event
         # and we don't want to interfere with another operation.
-        self.reload(force_start=False)
+        if changed:
+            self.reload(force_start=False)
         logger.debug("Update and reload duration (ms): %s", (time.time_ns() - start_time) / 1e6)
 
+    def _update_zone_files(self, zones: list[models.Zone], topology: models.Topology) -> bool:
+        """Write the zonefiles whose content changed.
+
+        Args:
+            zones: list of the zones to write
+            topology: Topology of the current deployment
+
+        Returns:
+            True if at least one zonefile was rewritten.
+        """
+        changed = False
+        zone_files: dict[str, str] = self._zones_to_files_content(zones, topology)
+        for domain, content in zone_files.items():
+            path = pathlib.Path(constants.DNS_CONFIG_DIR) / f"db.{domain}"
+            # The first line of a zonefile is its hash (templates.zone_header):
+            # when it matches the new content, the zone is unchanged
+            # and the file does not need to be rewritten
+            if self._read_zonefile_header(path) == content.split("\n", 1)[0]:
+                continue
+            self._write_file(path, content)
+            changed = True
+        return changed
+
+    def _update_named_conf_local(self, zones: list[str], topology: models.Topology | None) -> bool:
+        """Write `named.conf.local` if its content changed.
+
+        Args:
+            zones: A list of all the zones names
+            topology: Topology of the current deployment
+
+        Returns:
+            True if the file was rewritten.
+        """
+        named_conf_path = pathlib.Path(constants.DNS_CONFIG_DIR) / "named.conf.local"
+        named_conf_content = self._generate_named_conf_local(zones, topology)
+        try:
+            if named_conf_path.read_text(encoding="utf-8") == named_conf_content:
+                return False
+        except FileNotFoundError:
+            pass
+        self._write_file(named_conf_path, named_conf_content)
+        return True
+
+    @_raise_as(InstallError)
     def _install_snap_package(
         self, snap_name: str, snap_channel: str, refresh: bool = False
     ) -> None:
         """Installs snap package.
 
+        Snap failures are raised as InstallError by the _raise_as decorator.
+
         Args:
             snap_name: the snap package to install
             snap_channel: the snap package channel
             refresh: whether to refresh the snap if it's already present.
-
-        Raises:
-            InstallError: when encountering a SnapError or a SnapNotFoundError
         """
-        try:
-            snap_cache = snap.SnapCache()
-            snap_package = snap_cache[snap_name]
+        if self._snap_cache is None:
+            self._snap_cache = snap.SnapCache()
+        snap_package = self._snap_cache[snap_name]
 
-            if not snap_package.present or refresh:
-                snap_package.ensure(snap.SnapState.Latest, channel=snap_channel)
-        except (snap.SnapError, snap.SnapNotFoundError, subprocess.CalledProcessError) as e:
-            error_msg = f"An exception occurred when installing {snap_name}. Reason: {e}"
-            logger.exception(error_msg)
-            raise InstallError(error_msg) from e
+        if not snap_package.present or refresh:
+            snap_package.ensure(snap.SnapState.Latest, channel=snap_channel)
 
     def _zones_to_files_content(
         self, zones: list[models.Zone], topology: models.Topology
@@ -280,38 +413,58 @@ class BindService:
             and the values the content of the zone file
         """
         zone_files: dict[str, str] = {}
-        for zone in zones:
-            content = templates.ZONE_APEX_TEMPLATE.format(
-                zone=zone.domain,
-                # The serial is the timestamp divided by 60.
-                # We only need precision to the minute and want to avoid overflows
-                serial=int(time.time() / 60),
-            )
 
-            # By default, we hide the active unit.
-            # So only the standbies are used to respond to queries and receive NOTIFY events
-            # If we have no standby unit (a single unit deployment)
-            # then use current unit IP instead
-            ip_list: list[pydantic.IPvAnyAddress] = topology.standby_units_ip or [
-                topology.current_unit_ip
+        # By default, we hide the active unit.
+        # So only the standbies are used to respond to queries and receive NOTIFY events
+        # If we have no standby unit (a single unit deployment)
+        # then use current unit IP instead
+        ip_list: list[pydantic.IPvAnyAddress] = topology.standby_units_ip or [
+            topology.current_unit_ip
+        ]
+        # We sort the list to hopefully present the NS in a stable order in the file
+        sorted_ips = sorted(ip_list)
+        # The NS records rendered below are derived from the topology, not from the
+        # zone's entries: fold them into the header hash so that a topology change
+        # invalidates the zonefile even when the entries are unchanged.
+        # blake2b is used instead of hash() for stability across processes
+        topology_hash = int.from_bytes(
+            hashlib.blake2b("".join(str(ip) for ip in sorted_ips).encode()).digest(),
+            byteorder="big",
+        )
+
+        for zone in zones:
+            # Build the content as a list of chunks and join once:
+            # += on a string recopies the whole file for every record
+            content: list[str] = [
+                templates.zone_header(hash(zone) ^ topology_hash),
+                templates.ZONE_APEX_TEMPLATE.format(
+                    zone=zone.domain,
+                    # The serial is the timestamp divided by 60.
+                    # We only need precision to the minute and want to avoid overflows
+                    serial=int(time.time() / 60),
+                ),
             ]
-            # We sort the list to hopefully present the NS in a stable order in the file
-            for ip in sorted(ip_list):
-                content += templates.ZONE_APEX_NS_TEMPLATE.format(
+
+            content.extend(
+                templates.zone_apex_ns(
                     # We convert the IP to an int and use that as the NS record number
                     # This way, we generate a somewhat stable list of NS records
                     number=int(ip),
-                    ip=ip,
+                    ip=str(ip),
                 )
+                for ip in sorted_ips
+            )
 
-            for entry in zone.entries:
-                content += templates.ZONE_RECORD_TEMPLATE.format(
+            content.extend(
+                templates.zone_record(
                     host_label=entry.host_label,
                     record_class=entry.record_class,
                     record_type=entry.record_type,
-                    record_data=entry.record_data,
+                    record_data=str(entry.record_data),
                 )
-            zone_files[zone.domain] = content
+                for entry in zone.entries
+            )
+            zone_files[zone.domain] = "".join(content)
 
         return zone_files
 
@@ -328,28 +481,38 @@ class BindService:
             The content of `named.conf.local`
         """
         # It's good practice to include rfc1918
-        content: str = f'include "{constants.DNS_CONFIG_DIR}/zones.rfc1918";\n'
+        content: list[str] = [f'include "{constants.DNS_CONFIG_DIR}/zones.rfc1918";\n']
         # Include a zone specifically used for some services tests
-        content += templates.NAMED_CONF_PRIMARY_ZONE_DEF_TEMPLATE.format(
-            name=f"{constants.ZONE_SERVICE_NAME}",
-            absolute_path=f"{constants.DNS_CONFIG_DIR}/db.{constants.ZONE_SERVICE_NAME}",
-            zone_transfer_ips="",
+        content.append(
+            templates.named_conf_primary_zone_def(
+                name=f"{constants.ZONE_SERVICE_NAME}",
+                absolute_path=f"{constants.DNS_CONFIG_DIR}/db.{constants.ZONE_SERVICE_NAME}",
+                zone_transfer_ips="",
+            )
         )
         if topology is not None:
-            for name in zones:
-                if topology.is_current_unit_active:
-                    content += templates.NAMED_CONF_PRIMARY_ZONE_DEF_TEMPLATE.format(
+            if topology.is_current_unit_active:
+                # The rendered IP list is the same for every zone
+                zone_transfer_ips = self._bind_config_ip_list(topology.standby_units_ip)
+                content.extend(
+                    templates.named_conf_primary_zone_def(
                         name=name,
                         absolute_path=f"{constants.DNS_CONFIG_DIR}/db.{name}",
-                        zone_transfer_ips=self._bind_config_ip_list(topology.standby_units_ip),
+                        zone_transfer_ips=zone_transfer_ips,
                     )
-                else:
-                    content += templates.NAMED_CONF_SECONDARY_ZONE_DEF_TEMPLATE.format(
+                    for name in zones
+                )
+            else:
+                primary_ip = self._bind_config_ip_list([topology.active_unit_ip])
+                content.extend(
+                    templates.named_conf_secondary_zone_def(
                         name=name,
                         absolute_path=f"{constants.DNS_CONFIG_DIR}/db.{name}",
-                        primary_ip=self._bind_config_ip_list([topology.active_unit_ip]),
+                        primary_ip=primary_ip,
                     )
-        return content
+                    for name in zones
+                )
+        return "".join(content)
 
     def _bind_config_ip_list(self, ips: list[pydantic.IPvAnyAddress]) -> str:
         """Generate a string with a list of IPs that can be used in bind's config.
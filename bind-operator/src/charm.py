@@ -114,7 +114,6 @@ class BindCharm(ops.CharmBase):
         relation_data = self._get_remote_relation_data()
         if relation_data is None:
             return
-        self.unit.status = ops.MaintenanceStatus("Handling new relation requests")
         dns_record_provider_data = dns_data.create_dns_record_provider_data(relation_data)
         relation = self.model.get_relation(self.dns_record.relation_name, event.relation.id)
         if self.unit.is_leader():
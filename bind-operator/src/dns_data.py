@@ -4,6 +4,7 @@
 """DNS data logic."""
 
 import collections
+import hashlib
 import json
 import logging
 import typing
@@ -51,6 +52,26 @@ def create_dns_record_provider_data(
     return DNSRecordProviderData(dns_entries=statuses)
 
 
+def state_hash(zones: list[models.Zone], topology: models.Topology | None) -> str:
+    """Compute a hash of the zones and topology.
+
+    The zone hashes are sorted so that the result does not depend
+    on the order in which the zones were built.
+
+    Args:
+        zones: list of the zones
+        topology: Topology of the current deployment
+
+    Returns:
+        A hex digest summarizing the zones and the topology
+    """
+    h = hashlib.blake2b()
+    for zone_hash in sorted(hash(zone) for zone in zones):
+        h.update(zone_hash.to_bytes((zone_hash.bit_length() + 7) // 8, byteorder="big"))
+    h.update(str(topology.model_dump(mode="json") if topology is not None else None).encode())
+    return h.hexdigest()
+
+
 def has_changed(
     relation_data: list[tuple[DNSRecordRequirerData, DNSRecordProviderData]],
     topology: models.Topology | None,
@@ -73,13 +94,26 @@ def has_changed(
     """
     zones = dns_record_relations_data_to_zones(relation_data)
 
+    # Compare the stored hash when present: a single digest comparison
+    # instead of a structural comparison of every entry
+    last_hash = last_valid_state.get("hash")
+    if last_hash is not None:
+        return state_hash(zones, topology) != last_hash
+
+    # Fallback for state files predating the stored hash:
+    # reconstruct the models and compare them structurally.
     # We assume "zones" and "topology" keys exist in last_valid_state
     # As it was created from load_state()
 
-    if zones != last_valid_state["zones"]:
+    if zones != [models.Zone(**zone) for zone in last_valid_state["zones"]]:
         return True
 
-    if topology != last_valid_state["topology"]:
+    last_topology = (
+        models.Topology(**last_valid_state["topology"])
+        if last_valid_state["topology"] is not None
+        else None
+    )
+    if topology != last_topology:
         return True
 
     return False
@@ -96,19 +130,17 @@ def record_requirer_data_to_zones(
     Returns:
         A list of zones
     """
-    zones_entries: dict[str, list[RequirerEntry]] = {}
+    zones_entries: dict[str, list[RequirerEntry]] = collections.defaultdict(list)
     for entry in record_requirer_data.dns_entries:
-        if entry.domain not in zones_entries:
-            zones_entries[entry.domain] = []
         zones_entries[entry.domain].append(entry)
 
-    zones: list[models.Zone] = []
-    for domain, entries in zones_entries.items():
-        zone = models.Zone(domain=domain, entries=set())
-        for entry in entries:
-            zone.entries.add(models.create_dns_entry_from_requirer_entry(entry))
-        zones.append(zone)
-    return zones
+    return [
+        models.Zone(
+            domain=domain,
+            entries={models.create_dns_entry_from_requirer_entry(entry) for entry in entries},
+        )
+        for domain, entries in zones_entries.items()
+    ]
 
 
 def get_conflicts(zones: list[models.Zone]) -> tuple[set[models.DnsEntry], set[models.DnsEntry]]:
@@ -124,7 +156,8 @@ def get_conflicts(zones: list[models.Zone]) -> tuple[set[models.DnsEntry], set[m
 
     for z in zones:
         for e in z.entries:
-            look_alikes[f"{e.domain},{e.host_label},{e.record_class},{e.record_type}"].append(e)
+            # A tuple key avoids formatting a string per entry
+            look_alikes[(e.domain, e.host_label, e.record_class, e.record_type)].append(e)
 
     conflicting = set()
     non_conflicting = set()
@@ -139,6 +172,14 @@ def get_conflicts(zones: list[models.Zone]) -> tuple[set[models.DnsEntry], set[m
     return (non_conflicting, conflicting)
 
 
+# Cache of the last dns_record_relations_data_to_zones() conversion.
+# A hook typically converts the same relation data object several times
+# (change detection, conflict checking, zonefile generation), and each Juju
+# event runs in a fresh process, so keying on the input's identity is safe.
+# The lowercase name is intentional: this is a mutable cache, not a constant
+_zones_cache: tuple[list, list[models.Zone]] | None = None  # pylint: disable=invalid-name
+
+
 def dns_record_relations_data_to_zones(
     relation_data: list[tuple[DNSRecordRequirerData, DNSRecordProviderData]],
 ) -> list[models.Zone]:
@@ -150,14 +191,20 @@ def dns_record_relations_data_to_zones(
     Returns:
         The zones from the record_requirer_data
     """
-    zones: dict[str, models.Zone] = {}
+    global _zones_cache  # pylint: disable=global-statement
+    if _zones_cache is not None and _zones_cache[0] is relation_data:
+        return _zones_cache[1]
+    # Group the entries of every relation in one pass instead of building
+    # intermediate Zone lists per requirer and merging them afterwards
+    zones_entries: dict[str, set[models.DnsEntry]] = collections.defaultdict(set)
     for record_requirer_data, _ in relation_data:
-        for new_zone in record_requirer_data_to_zones(record_requirer_data):
-            if new_zone.domain in zones:
-                zones[new_zone.domain].entries.update(new_zone.entries)
-            else:
-                zones[new_zone.domain] = new_zone
-    return list(zones.values())
+        for entry in record_requirer_data.dns_entries:
+            zones_entries[entry.domain].add(models.create_dns_entry_from_requirer_entry(entry))
+    zones = [
+        models.Zone(domain=domain, entries=entries) for domain, entries in zones_entries.items()
+    ]
+    _zones_cache = (relation_data, zones)
+    return _zones_cache[1]
 
 
 def dump_state(zones: list[models.Zone], topology: models.Topology) -> str:
@@ -178,6 +225,7 @@ def dump_state(zones: list[models.Zone], topology: models.Topology) -> str:
     to_dump = {
         "topology": topology.model_dump(mode="json") if topology is not None else None,
         "zones": [zone.model_dump(mode="json") for zone in zones if zone is not None],
+        "hash": state_hash(zones, topology),
     }
     return json.dumps(to_dump)
 
@@ -185,7 +233,11 @@ def dump_state(zones: list[models.Zone], topology: models.Topology) -> str:
 def load_state(serialized_state: str) -> dict[str, typing.Any]:
     """Load the serialized state.
 
-    The serialized state is assumed to have been produced by dump_state()
+    The serialized state is assumed to have been produced by dump_state().
+    The zones and topology are kept as plain dicts: has_changed() only needs
+    the stored hash, so validating every entry through pydantic here would be
+    wasted work on the every-minute reload path. The models are reconstructed
+    by has_changed() only for state files predating the stored hash.
 
     Args:
         serialized_state:json string of the previously dumped state
@@ -193,8 +245,4 @@ def load_state(serialized_state: str) -> dict[str, typing.Any]:
     Returns:
         The loaded state
     """
-    state = json.loads(serialized_state)
-    if state["topology"] is not None:
-        state["topology"] = models.Topology(**state["topology"])
-    state["zones"] = [models.Zone(**zone) for zone in state["zones"]]
-    return state
+    return json.loads(serialized_state)
@@ -13,6 +13,7 @@ class DnsEntry(pydantic.BaseModel):
     """Class used to represent a DNS entry.
 
     Attributes:
+        model_config: pydantic configuration freezing the entries after construction
         domain: example: "dns.test"
         host_label: example: "admin"
         ttl: example: 600
@@ -21,6 +22,10 @@ class DnsEntry(pydantic.BaseModel):
         record_data: example: "42.42.42.42"
     """
 
+    # Entries are frozen: they live in sets (Zone.entries, conflict detection)
+    # and their hash must not change after construction
+    model_config = pydantic.ConfigDict(frozen=True)
+
     domain: str = pydantic.Field(min_length=1)
     host_label: str = pydantic.Field(min_length=1)
     ttl: int
@@ -28,16 +33,40 @@ class DnsEntry(pydantic.BaseModel):
     record_type: RecordType
     record_data: pydantic.IPvAnyAddress
 
+    _hash_cache: int | None = pydantic.PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two entries on their declared fields.
+
+        Pydantic's default comparison also includes private attributes,
+        which would make the cached hash part of the equality.
+
+        Args:
+            other: the object to compare with
+
+        Returns:
+            True if both entries have the same fields.
+        """
+        if not isinstance(other, DnsEntry):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
     def __hash__(self) -> int:
         """Get a hash of a DnsEntry based on its attributes.
 
+        Entries are hashed constantly (set membership during deduplication
+        and conflict detection, zone hashing), so the hash is computed once
+        and cached: the model is frozen, making this safe.
+
         Returns:
             A hash for the current object.
         """
-        h = hashlib.blake2b()
-        for data in (getattr(self, k) for k in self.__dict__):
-            h.update(str(data).encode())
-        return int.from_bytes(h.digest(), byteorder="big")
+        if self._hash_cache is None:
+            h = hashlib.blake2b()
+            for data in (getattr(self, k) for k in self.__dict__):
+                h.update(str(data).encode())
+            self._hash_cache = int.from_bytes(h.digest(), byteorder="big")
+        return self._hash_cache
 
 
 class Zone(pydantic.BaseModel):
@@ -50,20 +79,44 @@ class Zone(pydantic.BaseModel):
 
     domain: str
     entries: set[DnsEntry]
+    _hash_cache: int | None = pydantic.PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two zones on their declared fields.
+
+        Pydantic's default comparison also includes private attributes,
+        which would make the cached hash part of the equality.
+
+        Args:
+            other: the object to compare with
+
+        Returns:
+            True if both zones have the same domain and entries.
+        """
+        if not isinstance(other, Zone):
+            return NotImplemented
+        return self.domain == other.domain and self.entries == other.entries
 
     def __hash__(self) -> int:
         """Get a hash of a Zone based on its DNSEntries.
 
+        The hash is computed once and cached: zones are hashed for every
+        zonefile write and every change detection, and their entries are not
+        modified once they have been assembled from the relation data.
+
         Returns:
             A hash for the current object.
         """
-        h = hashlib.blake2b()
-        # We sort the list of entries to make sure that the elements are always in the same order
-        # This is true because `sorted()` is guaranteed to be stable
-        # https://docs.python.org/3/library/functions.html#sorted
-        for entry_hash in sorted([hash(e) for e in self.entries]):
-            h.update(entry_hash.to_bytes((entry_hash.bit_length() + 7) // 8, byteorder="big"))
-        return int.from_bytes(h.digest(), byteorder="big")
+        if self._hash_cache is None:
+            h = hashlib.blake2b()
+            # We sort the list of entries to make sure
+            # that the elements are always in the same order
+            # This is true because `sorted()` is guaranteed to be stable
+            # https://docs.python.org/3/library/functions.html#sorted
+            for entry_hash in sorted([hash(e) for e in self.entries]):
+                h.update(entry_hash.to_bytes((entry_hash.bit_length() + 7) // 8, byteorder="big"))
+            self._hash_cache = int.from_bytes(h.digest(), byteorder="big")
+        return self._hash_cache
 
 
 def create_dns_entry_from_requirer_entry(requirer_entry: RequirerEntry) -> DnsEntry:
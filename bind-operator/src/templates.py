@@ -20,24 +20,92 @@ $TTL 600
 @ IN SOA {zone}. mail.{zone}. ( {serial} 1d 1h 1h 10m )
 """
 
-ZONE_APEX_NS_TEMPLATE = "@ IN NS ns{number}.\nns{number} IN A {ip}\n"
-
-ZONE_RECORD_TEMPLATE = "{host_label} {record_class} {record_type} {record_data}\n"
-
-NAMED_CONF_PRIMARY_ZONE_DEF_TEMPLATE = (
-    'zone "{name}" IN {{ '
-    'type primary; file "{absolute_path}"; allow-update {{ none; }}; '
-    "also-notify {{ {zone_transfer_ips} }}; "
-    "allow-transfer {{ {zone_transfer_ips} }}; }};\n"
-)
-
-NAMED_CONF_SECONDARY_ZONE_DEF_TEMPLATE = (
-    'zone "{name}" IN {{ '
-    'type secondary; file "{absolute_path}"; '
-    "masterfile-format text; "
-    "masterfile-style full; "
-    "primaries {{ {primary_ip} }}; }};\n"
-)
+
+# The following templates are rendered in loops (once per record or per zone),
+# so they are plain functions: f-strings are compiled once at import time
+# while str.format re-parses its format string on every call.
+
+
+def zone_header(zone_hash: int) -> str:
+    """Render the comment line holding the hash of the zonefile's content.
+
+    This line is used to detect unchanged zonefiles without parsing them.
+
+    Args:
+        zone_hash: hash covering the zone's entries and the rendered NS records
+
+    Returns:
+        The rendered header line
+    """
+    return f"; HASH:{zone_hash}\n"
+
+
+def zone_apex_ns(number: int, ip: str) -> str:
+    """Render the NS records of a zone apex.
+
+    Args:
+        number: NS record number
+        ip: IP of the nameserver
+
+    Returns:
+        The rendered NS records
+    """
+    return f"@ IN NS ns{number}.\nns{number} IN A {ip}\n"
+
+
+def zone_record(host_label: str, record_class: str, record_type: str, record_data: str) -> str:
+    """Render a DNS record line.
+
+    Args:
+        host_label: host label of the record
+        record_class: class of the record
+        record_type: type of the record
+        record_data: data of the record
+
+    Returns:
+        The rendered record line
+    """
+    return f"{host_label} {record_class} {record_type} {record_data}\n"
+
+
+def named_conf_primary_zone_def(name: str, absolute_path: str, zone_transfer_ips: str) -> str:
+    """Render a primary zone definition for named.conf.local.
+
+    Args:
+        name: name of the zone
+        absolute_path: absolute path of the zonefile
+        zone_transfer_ips: ";" separated list of IPs allowed to transfer the zone
+
+    Returns:
+        The rendered zone definition
+    """
+    return (
+        f'zone "{name}" IN {{ '
+        f'type primary; file "{absolute_path}"; allow-update {{ none; }}; '
+        f"also-notify {{ {zone_transfer_ips} }}; "
+        f"allow-transfer {{ {zone_transfer_ips} }}; }};\n"
+    )
+
+
+def named_conf_secondary_zone_def(name: str, absolute_path: str, primary_ip: str) -> str:
+    """Render a secondary zone definition for named.conf.local.
+
+    Args:
+        name: name of the zone
+        absolute_path: absolute path of the zonefile
+        primary_ip: ";" separated list of the primary's IP
+
+    Returns:
+        The rendered zone definition
+    """
+    return (
+        f'zone "{name}" IN {{ '
+        f'type secondary; file "{absolute_path}"; '
+        "masterfile-format text; "
+        "masterfile-style full; "
+        f"primaries {{ {primary_ip} }}; }};\n"
+    )
+
 
 DISPATCH_EVENT_SERVICE = """[Unit]
 Description=Dispatch the {event} event on {unit}
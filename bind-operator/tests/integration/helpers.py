@@ -4,16 +4,19 @@
 
 """Helper functions for the integration tests."""
 
+import asyncio
+import functools
 import json
 import logging
+import os
 import pathlib
 import random
 import string
 import tempfile
-import time
 
 import juju.application
 import ops
+import pydantic
 from pytest_operator.plugin import OpsTest
 
 import constants
@@ -21,6 +24,10 @@ import models
 
 logger = logging.getLogger(__name__)
 
+# Serializes a list of entries straight to JSON in one pydantic-core pass,
+# without materializing an intermediate list of dicts for json.dumps
+_DNS_ENTRIES_ADAPTER = pydantic.TypeAdapter(list[models.DnsEntry])
+
 
 class ExecutionError(Exception):
     """Exception raised when execution fails.
@@ -51,7 +58,7 @@ def _generate_random_filename(length: int = 24, extension: str = "") -> str:
     characters = string.ascii_letters + string.digits
     # Disabling sec checking here since we're not looking
     # to generate something cryptographically secure
-    random_string = "".join(random.choice(characters) for _ in range(length))  # nosec
+    random_string = "".join(random.choices(characters, k=length))  # nosec
     if extension:
         if "." in extension:
             pieces = extension.split(".")
@@ -104,19 +111,26 @@ async def push_to_unit(
         mode: the mode of the file
     """
     assert unit is not None
-    _, temp_path = tempfile.mkstemp()
-    with open(temp_path, "w", encoding="utf-8") as fd:
-        fd.writelines(source)
-
-    temp_filename_on_workload = _generate_random_filename()
-    # unit does have scp_to
-    await unit.scp_to(source=temp_path, destination=temp_filename_on_workload)  # type: ignore
-    mv_cmd = f"sudo mv -f /home/ubuntu/{temp_filename_on_workload} {destination}"
-    await run_on_unit(ops_test, unit.name, mv_cmd)
-    chown_cmd = f"sudo chown {user}:{group} {destination}"
-    await run_on_unit(ops_test, unit.name, chown_cmd)
-    chmod_cmd = f"sudo chmod {mode} {destination}"
-    await run_on_unit(ops_test, unit.name, chmod_cmd)
+    temp_fd, temp_path = tempfile.mkstemp()
+    try:
+        # Reuse the descriptor from mkstemp and write the content in one call:
+        # writelines(source) iterated the string character by character
+        with os.fdopen(temp_fd, "w", encoding="utf-8") as fd:
+            fd.write(source)
+
+        temp_filename_on_workload = _generate_random_filename()
+        # unit does have scp_to
+        await unit.scp_to(source=temp_path, destination=temp_filename_on_workload)  # type: ignore
+        # One remote invocation instead of three: each juju exec call
+        # is a full SSH handshake and controller round-trip
+        install_cmd = (
+            f"sudo mv -f /home/ubuntu/{temp_filename_on_workload} {destination} "
+            f"&& sudo chown {user}:{group} {destination} "
+            f"&& sudo chmod {mode} {destination}"
+        )
+        await run_on_unit(ops_test, unit.name, install_cmd)
+    finally:
+        os.unlink(temp_path)
 
 
 async def dispatch_to_unit(
@@ -140,6 +154,22 @@ async def dispatch_to_unit(
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _read_source_file(path: str) -> str:
+    """Read a source file injected in any-charm deployments.
+
+    The content never changes during a test session, so it is read
+    from disk only once per session.
+
+    Args:
+        path: path of the file, relative to the repository root
+
+    Returns:
+        The content of the file
+    """
+    return pathlib.Path(path).read_text(encoding="utf-8")
+
+
 async def generate_anycharm_relation(
     app: juju.application.Application,
     ops_test: OpsTest,
@@ -157,14 +187,9 @@ async def generate_anycharm_relation(
         machine: The machine to deploy the any-charm onto
     """
     any_app_name = any_charm_name
-    any_charm_content = pathlib.Path("tests/integration/any_charm.py").read_text(encoding="utf-8")
-    dns_record_content = pathlib.Path("lib/charms/bind/v0/dns_record.py").read_text(
-        encoding="utf-8"
-    )
-
     any_charm_src_overwrite = {
-        "any_charm.py": any_charm_content,
-        "dns_record.py": dns_record_content,
+        "any_charm.py": _read_source_file("tests/integration/any_charm.py"),
+        "dns_record.py": _read_source_file("lib/charms/bind/v0/dns_record.py"),
     }
 
     # We deploy https://charmhub.io/any-charm and inject the any_charm.py behavior
@@ -201,7 +226,7 @@ async def change_anycharm_relation(
     await push_to_unit(
         ops_test=ops_test,
         unit=anyapp_unit,
-        source=json.dumps([e.model_dump(mode="json") for e in dns_entries]),
+        source=_DNS_ENTRIES_ADAPTER.dump_json(dns_entries).decode(),
         destination="/srv/dns_entries.json",
     )
 
@@ -231,15 +256,35 @@ async def dig_query(
     Returns: the result of the DNS query
     """
     result: str = ""
-    for _ in range(5):
+    for attempt in range(5):
         result = (await run_on_unit(ops_test, unit.name, f"dig {cmd}")).strip()
         if (result.strip() != "" and "timed out" not in result) or not retry:
             break
-        time.sleep(wait)
+        # asyncio.sleep yields to the event loop (time.sleep would stall
+        # every concurrent query); the backoff doubles on each attempt but is
+        # capped at twice the base wait so the failure path stays bounded
+        await asyncio.sleep(min(wait * (2**attempt), 2 * wait))
 
     return result
 
 
+def _get_peer_relation(show_unit_output: str, unit_name: str) -> dict | None:
+    """Extract the bind-peers relation from a juju show-unit output.
+
+    Args:
+        show_unit_output: JSON output of `juju show-unit <unit_name>`
+        unit_name: name of the queried unit
+
+    Returns:
+        The peer relation data if it exists, None otherwise
+    """
+    data = json.loads(show_unit_output)
+    return next(
+        (r for r in data[unit_name]["relation-info"] if r["endpoint"] == "bind-peers"),
+        None,
+    )
+
+
 async def get_active_unit(
     app: juju.application.Application, ops_test: OpsTest
 ) -> ops.model.Unit | None:
@@ -252,14 +297,14 @@ async def get_active_unit(
     Returns:
         The current active unit if it exists, None otherwise
     """
-    for unit in app.units:
+    # Query all the units concurrently: each show-unit is a subprocess
+    # round-trip and awaiting them sequentially serializes that latency
+    results = await asyncio.gather(
+        *(ops_test.juju("show-unit", unit.name, "--format", "json") for unit in app.units)
+    )
+    for unit, result in zip(app.units, results):
         # We take `[1]` because `[0]` is the return code of the process
-        data = json.loads((await ops_test.juju("show-unit", unit.name, "--format", "json"))[1])
-        relations = data[unit.name]["relation-info"]
-        for relation in relations:
-            if relation["endpoint"] == "bind-peers":
-                peer_relation = relation
-                break
+        peer_relation = _get_peer_relation(result[1], unit.name)
         if peer_relation is None:
             continue
         if "active-unit" not in peer_relation["application-data"]:
@@ -286,17 +331,11 @@ async def check_if_active_unit_exists(
     """
     unit = app.units[0]
     # We take `[1]` because `[0]` is the return code of the process
-    data = json.loads((await ops_test.juju("show-unit", unit.name, "--format", "json"))[1])
-    relations = data[unit.name]["relation-info"]
-    for relation in relations:
-        if relation["endpoint"] == "bind-peers":
-            peer_relation = relation
-            break
+    result = await ops_test.juju("show-unit", unit.name, "--format", "json")
+    peer_relation = _get_peer_relation(result[1], unit.name)
     if peer_relation is None:
         return False
-    if "active-unit" not in peer_relation["application-data"]:
-        return False
-    active_unit = peer_relation["application-data"]["active-unit"]
+    active_unit = peer_relation["application-data"].get("active-unit")
     if not active_unit:
         return False
 
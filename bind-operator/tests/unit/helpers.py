@@ -7,6 +7,7 @@
 # Ignore duplicate code from the helpers (they can be in the charm also)
 # pylint: disable=duplicate-code
 
+import json
 import uuid
 
 from charms.bind.v0 import dns_record
@@ -106,3 +107,18 @@ def dns_record_requirers_data_from_integration_datasets(
         record_requirers_data.append(record_requirer_data)
 
     return record_requirers_data
+
+
+def requirer_databag(record_requirer_data: dns_record.DNSRecordRequirerData) -> dict[str, str]:
+    """Serialize a DNSRecordRequirerData as its dns-record relation databag.
+
+    Args:
+        record_requirer_data: the requirer data to serialize
+
+    Returns:
+        The databag content as it would appear on the relation.
+    """
+    dumped_model = record_requirer_data.model_dump(exclude_unset=True)
+    return {
+        "dns_entries": json.dumps(dumped_model["dns_entries"], default=str),
+    }
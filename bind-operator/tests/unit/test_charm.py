@@ -238,10 +238,7 @@ def test_dns_record_relation_changed_without_conflict(context, base_state):
             ],
         ],
     )
-    dumped_model = record_requirers_data[0].model_dump(exclude_unset=True)
-    dumped_data = {
-        "dns_entries": json.dumps(dumped_model["dns_entries"], default=str),
-    }
+    dumped_data = tests.unit.helpers.requirer_databag(record_requirers_data[0])
 
     dns_record_relation = scenario.Relation(
         endpoint="dns-record",
@@ -254,7 +251,7 @@ def test_dns_record_relation_changed_without_conflict(context, base_state):
         "dns_record_relation_changed", relation=dns_record_relation
     )
     out = context.run(dns_record_relation_changed_event, state)
-    in_uuids = {str(x["uuid"]) for x in dumped_model["dns_entries"]}
+    in_uuids = {str(entry.uuid) for entry in record_requirers_data[0].dns_entries}
     for relation in out.relations:
         if relation.endpoint == "dns-record":
             data = json.loads(relation.local_app_data["dns_entries"])
@@ -280,10 +277,7 @@ def test_dns_record_relation_changed_without_conflict_not_leader(context, base_s
             ],
         ],
     )
-    dumped_model = record_requirers_data[0].model_dump(exclude_unset=True)
-    dumped_data = {
-        "dns_entries": json.dumps(dumped_model["dns_entries"], default=str),
-    }
+    dumped_data = tests.unit.helpers.requirer_databag(record_requirers_data[0])
 
     dns_record_relation = scenario.Relation(
         endpoint="dns-record",
@@ -323,13 +317,9 @@ def test_dns_record_relation_changed_with_conflict(context, base_state):
         ],
     )
     for record_requirer_data in record_requirers_data:
-        dumped_model = record_requirer_data.model_dump(exclude_unset=True)
-        dumped_data = {
-            "dns_entries": json.dumps(dumped_model["dns_entries"], default=str),
-        }
         dns_record_relation = scenario.Relation(
             endpoint="dns-record",
-            remote_app_data=dumped_data,
+            remote_app_data=tests.unit.helpers.requirer_databag(record_requirer_data),
         )
         base_state["relations"].append(dns_record_relation)
     base_state["leader"] = True
@@ -338,7 +328,6 @@ def test_dns_record_relation_changed_with_conflict(context, base_state):
         "dns_record_relation_changed", relation=dns_record_relation
     )
     out = context.run(dns_record_relation_changed_event, state)
-    # in_uuids = {str(x["uuid"]) for x in dumped_model["dns_entries"]}
     for relation in out.relations:
         if relation.endpoint == "dns-record" and relation.local_app_data:
             logger.debug("relation data: '%s'", relation.local_app_data)
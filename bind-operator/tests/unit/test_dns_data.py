@@ -282,4 +282,9 @@ def test_load_dump_state(integration_datasets, topology_data):
     serialized = dns_data.dump_state(zones, topology)
     state = dns_data.load_state(serialized)
 
-    assert state == {"zones": zones, "topology": topology}
+    # load_state keeps the zones and topology serialized (see its docstring)
+    assert state == {
+        "zones": [zone.model_dump(mode="json") for zone in zones],
+        "topology": topology.model_dump(mode="json") if topology is not None else None,
+        "hash": dns_data.state_hash(zones, topology),
+    }
@@ -7,8 +7,11 @@ import json
 import uuid
 
 import ops
+import ops.testing
+import pytest
+import scenario
+import yaml
 from charms.bind.v0 import dns_record
-from ops.testing import Harness
 
 REQUIRER_METADATA = """
 name: dns-record-consumer
@@ -30,89 +33,71 @@ UUID3 = uuid.uuid4()
 UUID4 = uuid.uuid4()
 
 
-def get_requirer_relation_data() -> dict[str, str]:
-    """Retrieve the requirer relation data.
-
-    Returns:
-        a dict with the relation data.
-    """
-    return {
-        "dns_entries": json.dumps(
-            [
-                {
-                    "domain": "cloud.canonical.com",
-                    "host_label": "admin",
-                    "ttl": 600,
-                    "record_class": "IN",
-                    "record_type": "A",
-                    "record_data": "91.189.91.48",
-                    "uuid": str(UUID3),
-                },
-                {
-                    "domain": "staging.ubuntu.com",
-                    "host_label": "www",
-                    "record_data": "91.189.91.47",
-                    "uuid": str(UUID4),
-                },
-            ]
-        ),
-    }
-
-
-def get_requirer_relation_data_partially_invalid() -> dict[str, str]:
-    """Retrieve the requirer relation data.
-
-    Returns:
-        a dict with the relation data.
-    """
-    return {
-        "dns_entries": json.dumps(
-            [
-                {
-                    "host_label": "admin",
-                    "ttl": 600,
-                    "record_class": "IN",
-                    "record_type": "A",
-                    "record_data": "91.189.91.48",
-                    "uuid": str(UUID3),
-                },
-                {
-                    "domain": "staging.ubuntu.com",
-                    "host_label": "www",
-                    "record_data": "91.189.91.47",
-                    "uuid": str(UUID4),
-                },
-            ]
-        ),
-    }
-
+# The relation databags are constants like PROVIDER_RELATION_DATA below:
+# serializing them once at import avoids re-running json.dumps in every test
+REQUIRER_RELATION_DATA = {
+    "dns_entries": json.dumps(
+        [
+            {
+                "domain": "cloud.canonical.com",
+                "host_label": "admin",
+                "ttl": 600,
+                "record_class": "IN",
+                "record_type": "A",
+                "record_data": "91.189.91.48",
+                "uuid": str(UUID3),
+            },
+            {
+                "domain": "staging.ubuntu.com",
+                "host_label": "www",
+                "record_data": "91.189.91.47",
+                "uuid": str(UUID4),
+            },
+        ]
+    ),
+}
 
-def get_requirer_relation_data_without_uuid() -> dict[str, str]:
-    """Retrieve the requirer relation data.
+REQUIRER_RELATION_DATA_PARTIALLY_INVALID = {
+    "dns_entries": json.dumps(
+        [
+            {
+                "host_label": "admin",
+                "ttl": 600,
+                "record_class": "IN",
+                "record_type": "A",
+                "record_data": "91.189.91.48",
+                "uuid": str(UUID3),
+            },
+            {
+                "domain": "staging.ubuntu.com",
+                "host_label": "www",
+                "record_data": "91.189.91.47",
+                "uuid": str(UUID4),
+            },
+        ]
+    ),
+}
 
-    Returns:
-        a dict with the relation data.
-    """
-    return {
-        "dns_entries": json.dumps(
-            [
-                {
-                    "domain": "cloud.canonical.com",
-                    "host_label": "admin",
-                    "ttl": 600,
-                    "record_class": "IN",
-                    "record_type": "A",
-                    "record_data": "91.189.91.48",
-                },
-                {
-                    "domain": "staging.ubuntu.com",
-                    "host_label": "www",
-                    "record_data": "91.189.91.47",
-                    "uuid": str(UUID4),
-                },
-            ]
-        ),
-    }
+REQUIRER_RELATION_DATA_WITHOUT_UUID = {
+    "dns_entries": json.dumps(
+        [
+            {
+                "domain": "cloud.canonical.com",
+                "host_label": "admin",
+                "ttl": 600,
+                "record_class": "IN",
+                "record_type": "A",
+                "record_data": "91.189.91.48",
+            },
+            {
+                "domain": "staging.ubuntu.com",
+                "host_label": "www",
+                "record_data": "91.189.91.47",
+                "uuid": str(UUID4),
+            },
+        ]
+    ),
+}
 
 
 def get_dns_record_requirer_data() -> dns_record.DNSRecordRequirerData:
@@ -218,203 +203,210 @@ class DNSRecordProviderCharm(ops.CharmBase):
         self.events.append(event)
 
 
-def test_dns_record_requirer_update_relation_data():
-    """
-    arrange: given a requirer charm.
-    act: modify the relation data.
-    assert: the relation data matches the one provided.
-    """
-    harness = Harness(DNSRecordRequirerCharm, meta=REQUIRER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
+@pytest.fixture(name="requirer_context")
+def requirer_context_fixture():
+    """Context fixture for the requirer charm."""
+    yield ops.testing.Context(DNSRecordRequirerCharm, meta=yaml.safe_load(REQUIRER_METADATA))
+
 
-    harness.add_relation("dns-record", "dns-record")
-    relation = harness.model.get_relation("dns-record")
-    harness.charm.dns_record.update_relation_data(relation, get_dns_record_requirer_data())
+@pytest.fixture(name="provider_context")
+def provider_context_fixture():
+    """Context fixture for the provider charm."""
+    yield ops.testing.Context(DNSRecordProviderCharm, meta=yaml.safe_load(PROVIDER_METADATA))
 
-    assert relation
-    assert relation.data[harness.model.app] == get_requirer_relation_data()
+
+def dns_record_relation(app_data: dict[str, str] | None = None) -> scenario.Relation:
+    """Create a dns-record relation with the given remote application data.
+
+    Args:
+        app_data: the remote application databag
+
+    Returns:
+        The relation.
+    """
+    return scenario.Relation(
+        endpoint="dns-record",
+        remote_app_name="dns-record",
+        remote_app_data=app_data if app_data is not None else {},
+    )
 
 
-def test_dns_record_requirer_emits_event():
+def test_dns_record_requirer_update_relation_data(requirer_context):
     """
     arrange: given a requirer charm.
-    act: update the remote relation databag with valid values.
-    assert: a DNSRecordRequestProcessed is emitted.
+    act: modify the relation data.
+    assert: the relation data matches the one provided.
     """
-    harness = Harness(DNSRecordRequirerCharm, meta=REQUIRER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
-
-    harness.add_relation("dns-record", "dns-record", app_data=PROVIDER_RELATION_DATA)
+    relation = dns_record_relation()
+    state = ops.testing.State(leader=True, relations={relation})
+
+    with requirer_context(requirer_context.on.update_status(), state) as manager:
+        charm_relation = manager.charm.model.get_relation("dns-record")
+        assert charm_relation
+        manager.charm.dns_record.update_relation_data(
+            charm_relation, get_dns_record_requirer_data()
+        )
+        out = manager.run()
 
-    events = harness.charm.events
-    assert len(events) == 1
-    assert events[0].dns_entries == DNS_RECORD_PROVIDER_DATA.dns_entries
+    assert out.get_relation(relation.id).local_app_data == REQUIRER_RELATION_DATA
 
 
-def test_dns_record_requirer_doesnt_emit_event_when_relation_data_invalid():
+def test_dns_record_requirer_emits_event(requirer_context):
     """
     arrange: given a requirer charm.
-    act: update the remote relation databag with invalid values.
-    assert: no DNSRecordRequestProcessed is emitted.
+    act: update the remote relation databag with valid values.
+    assert: a DNSRecordRequestProcessed is emitted.
     """
-    harness = Harness(DNSRecordRequirerCharm, meta=REQUIRER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
+    relation = dns_record_relation(PROVIDER_RELATION_DATA)
+    state = ops.testing.State(leader=True, relations={relation})
 
-    harness.add_relation("dns-record", "dns-record", app_data={})
+    with requirer_context(requirer_context.on.relation_changed(relation), state) as manager:
+        manager.run()
 
-    assert len(harness.charm.events) == 0
+        events = manager.charm.events
+        assert len(events) == 1
+        assert events[0].dns_entries == DNS_RECORD_PROVIDER_DATA.dns_entries
 
 
-def test_dns_record_requirer_doesnt_emit_event_when_relation_data_unparsable():
+@pytest.mark.parametrize(
+    "app_data",
+    [{}, {"invalid": "unparsable"}],
+    ids=["invalid", "unparsable"],
+)
+def test_dns_record_requirer_doesnt_emit_event(requirer_context, app_data):
     """
     arrange: given a requirer charm.
-    act: update the remote relation databag with unparsable values.
+    act: update the remote relation databag with invalid or unparsable values.
     assert: no DNSRecordRequestProcessed is emitted.
     """
-    harness = Harness(DNSRecordRequirerCharm, meta=REQUIRER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
+    relation = dns_record_relation(app_data)
+    state = ops.testing.State(leader=True, relations={relation})
 
-    harness.add_relation("dns-record", "dns-record", app_data={"invalid": "unparsable"})
+    with requirer_context(requirer_context.on.relation_changed(relation), state) as manager:
+        manager.run()
 
-    assert len(harness.charm.events) == 0
+        assert len(manager.charm.events) == 0
 
 
-def test_dns_record_provider_update_relation_data():
+def test_dns_record_provider_update_relation_data(provider_context):
     """
     arrange: given a provider charm.
     act: modify the relation data.
     assert: the relation data matches the one provided.
     """
-    harness = Harness(DNSRecordProviderCharm, meta=PROVIDER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
+    relation = dns_record_relation()
+    state = ops.testing.State(leader=True, relations={relation})
 
-    harness.add_relation("dns-record", "dns-record")
-    relation = harness.model.get_relation("dns-record")
-    harness.charm.dns_record.update_relation_data(relation, DNS_RECORD_PROVIDER_DATA)
+    with provider_context(provider_context.on.update_status(), state) as manager:
+        charm_relation = manager.charm.model.get_relation("dns-record")
+        assert charm_relation
+        manager.charm.dns_record.update_relation_data(charm_relation, DNS_RECORD_PROVIDER_DATA)
+        out = manager.run()
 
-    assert relation
-    assert relation.data[harness.model.app] == PROVIDER_RELATION_DATA
+    assert out.get_relation(relation.id).local_app_data == PROVIDER_RELATION_DATA
 
 
-def test_dns_record_provider_emits_event():
+def test_dns_record_provider_emits_event(provider_context):
     """
     arrange: given a provider charm.
     act: update the remote relation databag with valid values.
     assert: a DNSRecordRequestReceived is emitted.
     """
-    harness = Harness(DNSRecordProviderCharm, meta=PROVIDER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
+    relation = dns_record_relation(REQUIRER_RELATION_DATA)
+    state = ops.testing.State(leader=True, relations={relation})
 
-    harness.add_relation("dns-record", "dns-record", app_data=get_requirer_relation_data())
+    with provider_context(provider_context.on.relation_changed(relation), state) as manager:
+        manager.run()
 
-    events = harness.charm.events
-    assert len(events) == 1
-    assert events[0].dns_entries == get_dns_record_requirer_data().dns_entries
-    assert events[0].processed_entries == []
+        events = manager.charm.events
+        assert len(events) == 1
+        assert events[0].dns_entries == get_dns_record_requirer_data().dns_entries
+        assert events[0].processed_entries == []
 
 
-def test_dns_record_provider_emits_event_when_partially_valid():
+def test_dns_record_provider_emits_event_when_partially_valid(provider_context):
     """
     arrange: given a provider charm.
     act: update the remote relation databag with valid values.
     assert: a DNSRecordRequestReceived is emitted.
     """
-    harness = Harness(DNSRecordProviderCharm, meta=PROVIDER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
-
-    harness.add_relation(
-        "dns-record", "dns-record", app_data=get_requirer_relation_data_partially_invalid()
-    )
-
-    events = harness.charm.events
-    assert len(events) == 1
-    requirer_data = get_dns_record_requirer_data()
-    assert len(events[0].dns_entries) == 1
-    assert events[0].dns_entries[0] == (
-        requirer_data.dns_entries[1]  # pylint: disable=unsubscriptable-object
-    )
-    assert len(events[0].processed_entries) == 1
-    assert events[0].processed_entries[0].uuid == (
-        requirer_data.dns_entries[0].uuid  # pylint: disable=unsubscriptable-object
-    )
-    assert events[0].processed_entries[0].status == dns_record.Status.INVALID_DATA
-    assert events[0].processed_entries[0].description
+    relation = dns_record_relation(REQUIRER_RELATION_DATA_PARTIALLY_INVALID)
+    state = ops.testing.State(leader=True, relations={relation})
+
+    with provider_context(provider_context.on.relation_changed(relation), state) as manager:
+        manager.run()
+
+        events = manager.charm.events
+        assert len(events) == 1
+        requirer_data = get_dns_record_requirer_data()
+        assert len(events[0].dns_entries) == 1
+        assert events[0].dns_entries[0] == (
+            requirer_data.dns_entries[1]  # pylint: disable=unsubscriptable-object
+        )
+        assert len(events[0].processed_entries) == 1
+        assert events[0].processed_entries[0].uuid == (
+            requirer_data.dns_entries[0].uuid  # pylint: disable=unsubscriptable-object
+        )
+        assert events[0].processed_entries[0].status == dns_record.Status.INVALID_DATA
+        assert events[0].processed_entries[0].description
 
 
-def test_dns_record_provider_emits_event_when_partially_valid_ignores_no_uuid():
+def test_dns_record_provider_emits_event_when_partially_valid_ignores_no_uuid(provider_context):
     """
     arrange: given a provider charm.
     act: update the remote relation databag with valid values.
     assert: a DNSRecordRequestReceived is emitted.
     """
-    harness = Harness(DNSRecordProviderCharm, meta=PROVIDER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
-
-    harness.add_relation(
-        "dns-record", "dns-record", app_data=get_requirer_relation_data_without_uuid()
-    )
-
-    events = harness.charm.events
-    assert len(events) == 1
-    requirer_data = get_dns_record_requirer_data()
-    assert len(events[0].dns_entries) == 1
-    assert events[0].dns_entries[0] == (
-        requirer_data.dns_entries[1]  # pylint: disable=unsubscriptable-object
-    )
-    assert events[0].processed_entries == []
-
-
-def test_dns_record_provider_doesnt_emit_event_when_relation_data_invalid():
-    """
-    arrange: given a provider charm.
-    act: update the remote relation databag with invalid values.
-    assert: no DNSRecordRequestReceived is emitted.
-    """
-    harness = Harness(DNSRecordProviderCharm, meta=PROVIDER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
-
-    harness.add_relation("dns-record", "dns-record", app_data={"invalid": ""})
-
-    assert len(harness.charm.events) == 0
+    relation = dns_record_relation(REQUIRER_RELATION_DATA_WITHOUT_UUID)
+    state = ops.testing.State(leader=True, relations={relation})
+
+    with provider_context(provider_context.on.relation_changed(relation), state) as manager:
+        manager.run()
+
+        events = manager.charm.events
+        assert len(events) == 1
+        requirer_data = get_dns_record_requirer_data()
+        assert len(events[0].dns_entries) == 1
+        assert events[0].dns_entries[0] == (
+            requirer_data.dns_entries[1]  # pylint: disable=unsubscriptable-object
+        )
+        assert events[0].processed_entries == []
 
 
-def test_dns_record_provider_doesnt_emit_event_when_relation_data_unparsable():
+@pytest.mark.parametrize(
+    "app_data",
+    # An empty string value would be removed from the databag by juju,
+    # so an empty databag is the faithful equivalent here
+    [{}, {"dns_entries": "unparsable"}],
+    ids=["invalid", "unparsable"],
+)
+def test_dns_record_provider_doesnt_emit_event(provider_context, app_data):
     """
     arrange: given a provider charm.
-    act: update the remote relation databag with unparsable values.
+    act: update the remote relation databag with invalid or unparsable values.
     assert: no DNSRecordRequestReceived is emitted.
     """
-    harness = Harness(DNSRecordProviderCharm, meta=PROVIDER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
+    relation = dns_record_relation(app_data)
+    state = ops.testing.State(leader=True, relations={relation})
 
-    harness.add_relation("dns-record", "dns-record", app_data={"dns_entries": "unparsable"})
+    with provider_context(provider_context.on.relation_changed(relation), state) as manager:
+        manager.run()
 
-    assert len(harness.charm.events) == 0
+        assert len(manager.charm.events) == 0
 
 
-def test_dns_record_requirer_get_remote_relation_data():
+def test_dns_record_requirer_get_remote_relation_data(provider_context):
     """
     arrange: given a relation with requirer relation data.
     act: unserialize the relation data.
     assert: the resulting DNSRecordRequirerData is correct.
     """
-    harness = Harness(DNSRecordProviderCharm, meta=PROVIDER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
-    harness.disable_hooks()
-    harness.add_relation("dns-record", "dns-record", app_data=get_requirer_relation_data())
+    relation = dns_record_relation(REQUIRER_RELATION_DATA)
+    state = ops.testing.State(leader=True, relations={relation})
+
+    with provider_context(provider_context.on.update_status(), state) as manager:
+        result = manager.charm.dns_record.get_remote_relation_data()
 
-    result = harness.charm.dns_record.get_remote_relation_data()
     assert result == [
         (
             get_dns_record_requirer_data(),
@@ -423,18 +415,18 @@ def test_dns_record_requirer_get_remote_relation_data():
     ]
 
 
-def test_dns_record_provider_get_remote_relation_data():
+def test_dns_record_provider_get_remote_relation_data(requirer_context):
     """
     arrange: given a relation with provider relation data.
     act: unserialize the relation data.
     assert: the resulting DNSRecordProviderData is correct.
     """
-    harness = Harness(DNSRecordRequirerCharm, meta=REQUIRER_METADATA)
-    harness.begin()
-    harness.set_leader(True)
-    harness.add_relation("dns-record", "dns-record", app_data=PROVIDER_RELATION_DATA)
+    relation = dns_record_relation(PROVIDER_RELATION_DATA)
+    state = ops.testing.State(leader=True, relations={relation})
+
+    with requirer_context(requirer_context.on.update_status(), state) as manager:
+        result = manager.charm.dns_record.get_remote_relation_data()
 
-    result = harness.charm.dns_record.get_remote_relation_data()
     assert result == DNS_RECORD_PROVIDER_DATA
 
 
@@ -3,6 +3,8 @@
 
 """Create record request command."""
 
+import json
+
 from django.contrib.auth.models import User
 from django.core.management.base import BaseCommand
 
@@ -11,19 +13,25 @@ from policy.models import RecordRequest
 
 class Command(BaseCommand):
     """Create Record Request command."""
-    help = 'Create a new record request'
+    help = 'Create one or several new record requests'
 
     def add_arguments(self, parser):
         """Define CLI arguments."""
-        parser.add_argument('host_label', type=str, help='Host label')
-        parser.add_argument('domain', type=str, help='Domain name')
-        parser.add_argument('ttl', type=int, help='TTL')
-        parser.add_argument('record_type', type=str, help='Record type')
-        parser.add_argument('record_data', type=str, help='Record data')
+        parser.add_argument('host_label', type=str, help='Host label', nargs='?', default=None)
+        parser.add_argument('domain', type=str, help='Domain name', nargs='?', default=None)
+        parser.add_argument('ttl', type=int, help='TTL', nargs='?', default=None)
+        parser.add_argument('record_type', type=str, help='Record type', nargs='?', default=None)
+        parser.add_argument('record_data', type=str, help='Record data', nargs='?', default=None)
         parser.add_argument('--requirer_id', type=str, help='Requirer ID', nargs='?', default=None)
         parser.add_argument('--status', type=str, help='Status', nargs='?', default=RecordRequest.Status.PENDING)
         parser.add_argument('--status_reason', type=str, help='Status reason', nargs='?', default=None)
         parser.add_argument('--reviewer', type=str, help='Reviewer username', nargs='?', default=None)
+        parser.add_argument(
+            '--from-file',
+            type=str,
+            help='Path of a JSON file with a list of record requests to create in bulk',
+            default=None,
+        )
 
     def handle(self, *args, **options):
         """Handle CLI invocation."""
@@ -36,6 +44,7 @@ class Command(BaseCommand):
         status = options['status']
         status_reason = options['status_reason']
         reviewer_username = options['reviewer']
+        from_file = options['from_file']
 
         if reviewer_username:
             try:
@@ -46,6 +55,31 @@ class Command(BaseCommand):
         else:
             reviewer = None
 
+        if from_file:
+            with open(from_file, encoding='utf-8') as fd:
+                entries = json.load(fd)
+            # A single INSERT instead of one query per record
+            record_requests = RecordRequest.objects.bulk_create(
+                RecordRequest(
+                    domain=entry['domain'],
+                    host_label=entry['host_label'],
+                    ttl=entry.get('ttl'),
+                    record_type=entry['record_type'],
+                    record_data=entry['record_data'],
+                    requirer_id=entry.get('requirer_id', requirer_id),
+                    status=entry.get('status', status),
+                    status_reason=entry.get('status_reason', status_reason),
+                    reviewer=reviewer
+                )
+                for entry in entries
+            )
+            self.stdout.write(self.style.SUCCESS(f'{len(record_requests)} record requests created successfully'))
+            return
+
+        if None in (host_label, domain, ttl, record_type, record_data):
+            self.stdout.write(self.style.ERROR('Missing record request arguments (or use --from-file)'))
+            return
+
         record_request = RecordRequest(
             domain=domain,
             host_label=host_label,
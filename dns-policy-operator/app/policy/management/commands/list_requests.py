@@ -7,6 +7,9 @@ from django.core.management.base import BaseCommand
 
 from policy.models import RecordRequest
 
+# Built once at import time instead of on every parser invocation
+STATUS_CHOICES = RecordRequest.Status.values
+
 
 class Command(BaseCommand):
     """List record request command."""
@@ -14,7 +17,7 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         """Define arguments."""
-        parser.add_argument('status', type=str, help='Status of the requests to list')
+        parser.add_argument('status', type=str, help='Status of the requests to list', choices=STATUS_CHOICES)
 
     def handle(self, *args, **options):
         """Handle CLI invocation."""
@@ -7,6 +7,9 @@ from django.core.management.base import BaseCommand
 
 from policy.models import RecordRequest
 
+# Built once at import time instead of on every parser invocation
+STATUS_CHOICES = RecordRequest.Status.values
+
 
 class Command(BaseCommand):
     """Set record request status command."""
@@ -15,7 +18,7 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         """Define arguments."""
         parser.add_argument('request_id', type=str, help='ID of the request')
-        parser.add_argument('status', type=str, help='New status of the request')
+        parser.add_argument('status', type=str, help='New status of the request', choices=STATUS_CHOICES)
         parser.add_argument('--reason', type=str, help='Reason for the status change', default=None)
 
     def handle(self, *args, **options):
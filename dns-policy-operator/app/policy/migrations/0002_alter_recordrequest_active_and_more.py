@@ -0,0 +1,60 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The trigram indexes below need the pg_trgm extension
+        TrigramExtension(),
+        migrations.AlterField(
+            model_name='recordrequest',
+            name='active',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='recordrequest',
+            name='record_type',
+            field=models.CharField(db_index=True, max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='recordrequest',
+            name='requirer_id',
+            field=models.CharField(db_index=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='recordrequest',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('approved', 'Approved'), ('denied', 'Denied'), ('invalid', 'Invalid'), ('failed', 'Failed'), ('published', 'Published')], db_index=True, max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='recordrequest',
+            index=models.Index(fields=['status', 'domain'], name='policy_reco_status_ccd890_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recordrequest',
+            index=models.Index(fields=['domain', 'host_label'], name='policy_reco_domain_a194a3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recordrequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['host_label'], name='rr_hostlabel_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='recordrequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['domain'], name='rr_domain_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='recordrequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['record_data'], name='rr_recorddata_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy', '0002_alter_recordrequest_active_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recordrequest',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='recordrequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='rr_search_vector_gin'),
+        ),
+        # Keep search_vector up to date from the database itself so that rows
+        # created outside the ORM (e.g. raw SQL) are indexed too
+        migrations.RunSQL(
+            sql="""
+                CREATE TRIGGER recordrequest_search_vector_update
+                BEFORE INSERT OR UPDATE ON policy_recordrequest
+                FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(
+                    search_vector, 'pg_catalog.simple',
+                    host_label, domain, record_type, record_data, status
+                );
+                UPDATE policy_recordrequest SET search_vector = to_tsvector(
+                    'pg_catalog.simple',
+                    coalesce(host_label, '') || ' ' || coalesce(domain, '') || ' '
+                    || coalesce(record_type, '') || ' ' || coalesce(record_data, '') || ' '
+                    || coalesce(status, '')
+                );
+            """,
+            reverse_sql=(
+                "DROP TRIGGER IF EXISTS recordrequest_search_vector_update"
+                " ON policy_recordrequest;"
+            ),
+        ),
+    ]
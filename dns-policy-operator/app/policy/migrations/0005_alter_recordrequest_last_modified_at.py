@@ -0,0 +1,19 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy', '0004_alter_recordrequest_uuid_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='recordrequest',
+            name='last_modified_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
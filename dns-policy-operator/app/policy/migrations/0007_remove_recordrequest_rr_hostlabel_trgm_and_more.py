@@ -0,0 +1,31 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy', '0006_recordrequest_policy_reco_status_f00e0c_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The tsvector search (migration 0003) replaced the admin ILIKE search
+        # these trigram indexes served: since then they were pure write
+        # overhead on every insert and update
+        migrations.RemoveIndex(
+            model_name='recordrequest',
+            name='rr_hostlabel_trgm',
+        ),
+        migrations.RemoveIndex(
+            model_name='recordrequest',
+            name='rr_domain_trgm',
+        ),
+        migrations.RemoveIndex(
+            model_name='recordrequest',
+            name='rr_recorddata_trgm',
+        ),
+    ]
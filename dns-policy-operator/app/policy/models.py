@@ -3,9 +3,10 @@
 
 """Define models."""
 
-import uuid
-
 from django.contrib.auth.models import User
+from django.contrib.postgres.functions import RandomUUID
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 
@@ -22,19 +23,34 @@ class RecordRequest(models.Model):
         FAILED = 'failed'
         PUBLISHED = 'published'
 
-    uuid = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    uuid = models.UUIDField(primary_key=True, db_default=RandomUUID(), editable=False)
     domain = models.CharField(max_length=255)
     host_label = models.CharField(max_length=255)
     ttl = models.IntegerField(null=True)
-    record_type = models.CharField(max_length=10)
+    record_type = models.CharField(max_length=10, db_index=True)
     record_data = models.CharField(max_length=255)
-    active = models.BooleanField(default=False)
-    requirer_id = models.CharField(max_length=255, null=True)
-    status = models.CharField(max_length=50, choices=Status.choices)
+    active = models.BooleanField(default=False, db_index=True)
+    requirer_id = models.CharField(max_length=255, null=True, db_index=True)
+    status = models.CharField(max_length=50, choices=Status.choices, db_index=True)
     status_reason = models.CharField(max_length=255, null=True)
     reviewer = models.ForeignKey(User, null=True, on_delete=models.SET_NULL)
     created_at = models.DateTimeField(default=timezone.now)
-    last_modified_at = models.DateTimeField(default=timezone.now)
+    last_modified_at = models.DateTimeField(auto_now=True)
+    # Maintained by a database trigger, see migration 0003
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        """Define indexes backing the admin changelist filters and searches."""
+        indexes = [
+            models.Index(fields=["status", "domain"]),
+            models.Index(fields=["domain", "host_label"]),
+            # Serves the approved-requests polling query in one index scan
+            models.Index(fields=["status", "active", "requirer_id"]),
+            GinIndex(fields=["search_vector"], name="rr_search_vector_gin"),
+            # Rows are inserted in creation order: a BRIN index keeps
+            # time-range scans cheap at a fraction of a btree's size
+            BrinIndex(fields=["created_at"], name="rr_created_at_brin"),
+        ]
 
     def __str__(self):
         """Record request model string representation."""
@@ -13,4 +13,7 @@ class RecordRequestSerializer(serializers.ModelSerializer):
     class Meta:
         """Define meta of the serializer."""
         model = RecordRequest
-        fields = '__all__'
+        # The trigger-maintained tsvector is an implementation detail of the
+        # admin search and the largest column of the table: keep it out of
+        # every API response
+        exclude = ['search_vector']